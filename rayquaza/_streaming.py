@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from asyncio import (
+    FIRST_COMPLETED as _FIRST_COMPLETED,
+    ensure_future as _ensure_future,
+    get_running_loop as _get_running_loop,
+    wait as _wait,
+    wait_for as _wait_for,
+)
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from .exception import BadResponseError
+
+if TYPE_CHECKING:
+    from .model import Message, MultiResponseRequest
+
+T = TypeVar("T")
+
+# The async generator driving multi-response requests lives here rather than
+# in core.py so the dispatch hot path stays compilable by mypyc, which does
+# not support async generators.
+
+
+async def multi_response_stream(
+    message: MultiResponseRequest[T],
+    callbacks: dict[int, Callable[[Message], Coroutine[Any, Any, Any]]] | None,
+    timeout: float | None,
+) -> AsyncIterator[T]:
+    if not callbacks:
+        return
+
+    response_type: type[T] = message.__mediator_response_type__
+
+    if len(callbacks) == 1:
+        (callback,) = callbacks.values()
+        coro = callback(message)
+        response = await coro if timeout is None else await _wait_for(coro, timeout)
+        if response is not None:
+            if type(response) is response_type or isinstance(response, response_type):
+                yield response
+            elif message.__mediator_skip_response_check__:
+                yield cast(T, response)
+            else:
+                raise BadResponseError(message, response, response_type)
+        return
+
+    deadline = None if timeout is None else _get_running_loop().time() + timeout
+    pending = {_ensure_future(callback(message)) for callback in callbacks.values()}
+    try:
+        while pending:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - _get_running_loop().time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+            done, pending = await _wait(pending, timeout=remaining, return_when=_FIRST_COMPLETED)
+            if not done:
+                raise asyncio.TimeoutError
+            for task in done:
+                response = task.result()
+                if response is None:
+                    continue
+                if type(response) is response_type or isinstance(response, response_type):
+                    yield response
+                elif message.__mediator_skip_response_check__:
+                    yield cast(T, response)
+                else:
+                    raise BadResponseError(message, response, response_type)
+    finally:
+        for task in pending:
+            task.cancel()
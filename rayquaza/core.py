@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import contextvars
+import sys
+from asyncio import (
+    ensure_future as _ensure_future,
+    get_running_loop as _get_running_loop,
+    wait as _wait,
+    wait_for as _wait_for,
+)
 from collections.abc import AsyncIterable, Callable, Coroutine
-from typing import TYPE_CHECKING, Any, TypeVar, overload
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
+from ._streaming import multi_response_stream
 from .exception import BadResponseError, MessagePublishedException, UnqualifiedRequestTypeException
 from .model import Message, Request, RequestType
 
@@ -12,20 +20,85 @@ if TYPE_CHECKING:
     from .model import SingleResponseRequest, MultiResponseRequest
     from .types import T_MSG
 
-from .utils import MISSING
-
 T = TypeVar("T")
 
 __all__ = ("Mediator",)
 
 
+async def _run_all(coros: list[Coroutine[Any, Any, Any]]) -> None:
+    # Lighter than asyncio.gather for fanout that discards results: no
+    # _GatheringFuture and no result list. Exceptions are still propagated
+    # and pending callbacks are cancelled if the fanout itself is cancelled.
+    tasks = [_ensure_future(coro) for coro in coros]
+    try:
+        done, _ = await _wait(tasks)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    # Retrieve every exception before raising so sibling failures don't get
+    # reported as never-retrieved by the event loop.
+    error: BaseException | None = None
+    for task in done:
+        exc = asyncio.CancelledError() if task.cancelled() else task.exception()
+        if error is None and exc is not None:
+            error = exc
+    if error is not None:
+        raise error
+
+
 class Mediator:
     """The mediator class that handles message passing between components."""
 
     def __init__(self) -> None:
-        self._callbacks: dict[tuple[str, type[Message]], set[Callable[[Message], Coroutine[Any, Any, Any]]]] = defaultdict(
-            set
-        )
+        self._callbacks: dict[str, dict[type[Message], dict[int, Callable[[Message], Coroutine[Any, Any, Any]]]]] = {}
+        self._publish_fns: dict[str, dict[type[Message], Callable[[Message, float | None], Coroutine[Any, Any, None]]]] = {}
+
+    def _compile_publish(
+        self,
+        channel: str,
+        message_type: type[Message],
+        callbacks: dict[int, Callable[[Message], Coroutine[Any, Any, Any]]],
+    ) -> Callable[[Message, float | None], Coroutine[Any, Any, None]]:
+        # Specialise the waiting publish path for the current subscriber set:
+        # the callbacks are bound as default arguments so the generated
+        # coroutine skips registry lookups and set iteration entirely. The
+        # cache entry is dropped whenever the subscriber set changes.
+        namespace: dict[str, Any] = {f"_callback_{index}": callback for index, callback in enumerate(callbacks.values())}
+        namespace["_wait_for"] = _wait_for
+        bindings = "".join(f"_callback_{index}=_callback_{index}, " for index in range(len(callbacks)))
+
+        if len(callbacks) == 1:
+            source = (
+                f"async def _publish(message, timeout, {bindings}_wait_for=_wait_for):\n"
+                "    if timeout is None:\n"
+                "        await _callback_0(message)\n"
+                "    else:\n"
+                "        await _wait_for(_callback_0(message), timeout)\n"
+            )
+        else:
+            namespace["_run_all"] = _run_all
+            calls = ", ".join(f"_callback_{index}(message)" for index in range(len(callbacks)))
+            source = (
+                f"async def _publish(message, timeout, {bindings}_run_all=_run_all, _wait_for=_wait_for):\n"
+                f"    runner = _run_all([{calls}])\n"
+                "    if timeout is None:\n"
+                "        await runner\n"
+                "    else:\n"
+                "        await _wait_for(runner, timeout)\n"
+            )
+
+        exec(source, namespace)
+        fn: Callable[[Message, float | None], Coroutine[Any, Any, None]] = namespace["_publish"]
+        self._publish_fns.setdefault(channel, {})[message_type] = fn
+        return fn
+
+    def _invalidate_publish_fn(self, channel: str, message_type: type[Message]) -> None:
+        channel_fns = self._publish_fns.get(channel)
+        if channel_fns is not None:
+            channel_fns.pop(message_type, None)
+            if not channel_fns:
+                del self._publish_fns[channel]
 
     async def publish(self, channel: str, message: Message, /, *, wait: bool = True, timeout: float | None = None) -> None:
         """|coro|
@@ -59,14 +132,31 @@ class Mediator:
         if message.__mediator_published__:
             raise MessagePublishedException(message)
 
+        cls = message.__class__
+        channel_map = self._callbacks.get(channel)
+        callbacks = channel_map.get(cls) if channel_map is not None else None
+        if not callbacks:
+            return
+
         if wait:
-            coros = (callback(message) for callback in self._callbacks[channel, message.__class__])
-            await asyncio.wait_for(asyncio.gather(*(coros)), timeout)
+            channel_fns = self._publish_fns.get(channel)
+            fn = channel_fns.get(cls) if channel_fns is not None else None
+            if fn is None:
+                fn = self._compile_publish(channel, cls, callbacks)
+            await fn(message, timeout)
         else:
-            for callback in self._callbacks[channel, message.__class__]:
-                asyncio.create_task(callback(message))
-
-    async def has_subscriptions(self, channel: str, message_type: type[Message]) -> bool:
+            loop = _get_running_loop()
+            if sys.version_info >= (3, 11):
+                # One context copy shared by the whole fanout instead of the
+                # per-task copy create_task would make on its own.
+                context = contextvars.copy_context()
+                for callback in callbacks.values():
+                    loop.create_task(callback(message), context=context)
+            else:
+                for callback in callbacks.values():
+                    loop.create_task(callback(message))
+
+    def has_subscriptions(self, channel: str, message_type: type[Message]) -> bool:
         """Checks if the mediator has any subscriptions for a message type.
 
         Parameters
@@ -81,31 +171,30 @@ class Mediator:
         :class:`bool`
             Whether the mediator has any subscriptions for the message type.
         """
-        return bool(self._callbacks[channel, message_type])
+        channel_map = self._callbacks.get(channel)
+        return channel_map is not None and bool(channel_map.get(message_type))
 
     async def _single_response_request(self, channel: str, message: SingleResponseRequest[T], timeout: float | None) -> T:
-        if not await self.has_subscriptions(channel, message.__class__):
-            raise RuntimeError(f"Request of type {message.__class__} has no active subscriptions.")
+        cls = message.__class__
+        if not self.has_subscriptions(channel, cls):
+            raise RuntimeError(f"Request of type {cls} has no active subscriptions.")
 
         response_type: type[T] = message.__mediator_response_type__
-        (callback,) = self._callbacks[channel, message.__class__]
-        response = await asyncio.wait_for(callback(message), timeout)
-        if not isinstance(response, response_type):
-            raise BadResponseError(message, response, response_type)
-        return response
-
-    async def _multi_response_request(
+        (callback,) = self._callbacks[channel][cls].values()
+        coro = callback(message)
+        response = await coro if timeout is None else await _wait_for(coro, timeout)
+        if type(response) is response_type or isinstance(response, response_type):
+            return response
+        if message.__mediator_skip_response_check__:
+            return cast(T, response)
+        raise BadResponseError(message, response, response_type)
+
+    def _multi_response_request(
         self, channel: str, message: MultiResponseRequest[T], timeout: float | None
     ) -> AsyncIterable[T]:
-        response_type: type[T] = message.__mediator_response_type__
-        callbacks = self._callbacks[channel, message.__class__]
-        for coro in asyncio.as_completed([callback(message) for callback in callbacks], timeout=timeout):
-            response = await coro
-            if response is None:
-                continue
-            if not isinstance(response, response_type):
-                raise BadResponseError(message, response, response_type)
-            yield response
+        channel_map = self._callbacks.get(channel)
+        callbacks = channel_map.get(message.__class__) if channel_map is not None else None
+        return multi_response_stream(message, callbacks, timeout)
 
     @overload
     def request(
@@ -167,10 +256,11 @@ class Mediator:
         if message.__mediator_published__:
             raise MessagePublishedException(message)
 
-        if message.__mediator_request_type__ is MISSING:
+        request_type = message.__mediator_request_type__
+        if request_type is None:
             raise UnqualifiedRequestTypeException(message)
 
-        if message.__mediator_request_type__ is RequestType.single:
+        if message.__mediator_is_single__:
             return self._single_response_request(channel, message, timeout)
 
         return self._multi_response_request(channel, message, timeout)
@@ -217,6 +307,14 @@ class Mediator:
             The callback to execute when a message of the specified type is published.
             In the case of a request, the callback should return the appropriate response.
 
+        .. note::
+
+            Subscriptions are tracked by callback identity, not equality. Keep a
+            reference to the exact callable object passed here — in particular,
+            every ``obj.method`` access creates a new bound-method object, so two
+            such accesses register (and fire) independently and only the original
+            object can be passed to :meth:`unsubscribe`.
+
         Raises:
         -------
         :class:`TypeError`
@@ -224,17 +322,24 @@ class Mediator:
         :class:`RuntimeError`
             The request type is :attr:`RequestType.single` and already has a subscription.
         """
-        if not issubclass(message_type, Message):
+        if not isinstance(message_type, type) or not issubclass(message_type, Message):
             raise TypeError("message_type must be a subclass of Message")
 
         if (
-            issubclass(message_type, Request)
-            and message_type.__mediator_request_type__ is RequestType.single
-            and self._callbacks[channel, message_type]
+            message_type.__mediator_is_request__
+            and message_type.__mediator_is_single__
+            and self._callbacks.get(channel, {}).get(message_type)
         ):
             raise RuntimeError("Request type already has a subscription")
 
-        self._callbacks[channel, message_type].add(callback)  # type: ignore  # I'm not sure why this is an error
+        channel_map = self._callbacks.setdefault(channel, {})
+        subscribers = channel_map.get(message_type)
+        if subscribers is None:
+            subscribers = channel_map[message_type] = {}
+        key = id(callback)
+        if key not in subscribers:
+            subscribers[key] = callback  # type: ignore  # I'm not sure why this is an error
+            self._invalidate_publish_fn(channel, message_type)
 
     def unsubscribe(
         self, channel: str, message_type: type[Message], callback: Callable[[Message], Coroutine[Any, Any, Any]]
@@ -248,8 +353,21 @@ class Mediator:
         message_type: type[:class:`Message`]
             The type of message to unsubscribe from.
         callback: Callable[[:class:`Message`],
-            The callback to remove from the subscription.
+            The callback to remove from the subscription. This must be the
+            identical callable object passed to :meth:`create_subscription`;
+            an equal but distinct object (such as a freshly accessed bound
+            method) raises :class:`KeyError`.
         """
-        self._callbacks[channel, message_type].remove(callback)
-        if not self._callbacks[channel, message_type]:
-            del self._callbacks[channel, message_type]
+        channel_map = self._callbacks.get(channel)
+        if channel_map is None:
+            raise KeyError(callback)
+        subscribers = channel_map.get(message_type)
+        if subscribers is None or id(callback) not in subscribers:
+            raise KeyError(callback)
+
+        del subscribers[id(callback)]
+        if not subscribers:
+            del channel_map[message_type]
+            if not channel_map:
+                del self._callbacks[channel]
+        self._invalidate_publish_fn(channel, message_type)
@@ -32,13 +32,17 @@ class RequestType(Enum):
 
 
 class _ModelBase:
-    pass
+    __slots__ = ()
 
 
 class Message(_ModelBase):
     """The base class for all mediator messages."""
 
+    __slots__ = ()
+
     __mediator_published__: bool = False
+    __mediator_is_request__: ClassVar[bool] = False
+    __mediator_is_single__: ClassVar[bool] = False
 
 
 class Request(Message, Generic[T, T_REQ]):
@@ -49,8 +53,12 @@ class Request(Message, Generic[T, T_REQ]):
         to create a request that expects a single or multiple responses respectively.
     """
 
-    __mediator_request_type__: ClassVar[RequestType]
+    __slots__ = ()
+
+    __mediator_is_request__: ClassVar[bool] = True
+    __mediator_request_type__: ClassVar[RequestType | None] = None
     __mediator_response_type__: ClassVar[type[Any]]
+    __mediator_skip_response_check__: ClassVar[bool] = False
 
     def __init_subclass__(cls) -> None:
         for orig_base in getattr(cls, "__orig_bases__", ()):
@@ -58,6 +66,7 @@ class Request(Message, Generic[T, T_REQ]):
                 response_type, request_type = get_args(orig_base)
                 cls.__mediator_response_type__ = response_type
                 cls.__mediator_request_type__ = get_args(request_type)[0]
+                cls.__mediator_is_single__ = cls.__mediator_request_type__ is RequestType.single
                 break
 
 
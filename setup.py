@@ -1,7 +1,23 @@
+import os
 import re
 
 import setuptools
 
+# Opt-in mypyc build for the dispatch hot path; the pure-Python module is
+# always shipped as a fallback. mypycify exits via SystemExit on failure, so
+# catch broadly and warn rather than failing the install.
+ext_modules = []
+if os.environ.get("RAYQUAZA_COMPILE"):
+    try:
+        from mypyc.build import mypycify
+
+        ext_modules = mypycify(["rayquaza/core.py"])
+    except (Exception, SystemExit) as e:
+        import warnings
+
+        warnings.warn(f"RAYQUAZA_COMPILE was set but the mypyc build failed ({e}); using the pure-Python modules")
+        ext_modules = []
+
 with open("docs/requirements.txt", "r") as stream:
     extras_require_docs = stream.read().splitlines()
 
@@ -46,6 +62,7 @@ setuptools.setup(
     author="bijij",
     author_email="josh@josh-is.gay",
     description="An asynchronous python mediator library.",
+    ext_modules=ext_modules,
     extras_require=extras_require,
     include_package_data=True,
     license="Apache Software License",